@@ -9,9 +9,13 @@ Features:
  - Downloads online images (picsum.photos) with caching and optional refresh
  - Shuffle / ordered modes, configurable duration
  - Saves session to session.json (resume next run)
- - Saves metadata to metadata.json (downloads + run events) suitable for later training
+ - Saves metadata to metadata.jsonl (downloads + run events, one JSON object per line) suitable for later training
  - Cross-platform wallpaper setter: Windows, macOS, GNOME, KDE Plasma (best-effort)
 Dependency: requests (only for online mode). tkinter optional for GUI picker.
+watchdog optional: picks up files added to / removed from session_images/ while looping.
+dbus-python optional: sets KDE Plasma wallpaper over D-Bus without spawning qdbus.
+orjson optional: faster metadata encoding.
+msgpack optional: with WALLPAPER_LOOPER_MSGPACK=1, session is saved as the smaller, faster session.msgpack.
 """
 
 from pathlib import Path
@@ -20,20 +24,52 @@ import sys
 import time
 import json
 import random
+import signal
+import threading
 import platform
 import ctypes
 import shutil
+import atexit
+import collections
 import subprocess
-from itertools import cycle
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
 # Try optional packages
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except Exception:
     REQUESTS_AVAILABLE = False
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except Exception:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except Exception:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import dbus
+    DBUS_AVAILABLE = True
+except Exception:
+    DBUS_AVAILABLE = False
+
 try:
     import tkinter as tk
     from tkinter import filedialog
@@ -47,48 +83,171 @@ SESSION_IMAGES_DIR = ROOT / "session_images"
 SESSION_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 
 SESSION_FILE = ROOT / "session.json"
-METADATA_FILE = ROOT / "metadata.json"
-
-# Ensure metadata file exists
-if not METADATA_FILE.exists():
-    METADATA_FILE.write_text("[]", encoding="utf-8")
+SESSION_MSGPACK_FILE = SESSION_FILE.with_suffix(".msgpack")
+# Opt-in binary session format (needs msgpack); session.json stays the default
+USE_MSGPACK_SESSION = MSGPACK_AVAILABLE and os.environ.get("WALLPAPER_LOOPER_MSGPACK") == "1"
+METADATA_FILE = ROOT / "metadata.jsonl"
+LEGACY_METADATA_FILE = ROOT / "metadata.json"
+
+# append-mode handle for metadata.jsonl, opened lazily on first flush
+_MD_FH = None
+# pending metadata entries, written out in batches by flush_metadata()
+_MD_QUEUE = collections.deque()
+_MD_LOCK = threading.Lock()
+METADATA_FLUSH_INTERVAL = 5       # seconds between background metadata flushes
+SESSION_SAVE_INTERVAL = 300       # seconds between periodic session saves in run_loop
 
 IMG_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp"}
+IMG_EXTS_NODOT = {e.lstrip(".") for e in IMG_EXTS}
+
+# Max parallel downloads (all hit picsum.photos, so one keep-alive pool serves them)
+DOWNLOAD_WORKERS = 8
 
-# Online reliable image source templates (picsum)
+# Online reliable image source URL builders (picsum), called with a random sig
 ONLINE_QUERIES = {
-    "nature": "https://picsum.photos/1920/1080?random={sig}",
-    "graffiti": "https://picsum.photos/1920/1080?random={sig}"
+    "nature": lambda sig: f"https://picsum.photos/1920/1080?random={sig}",
+    "graffiti": lambda sig: f"https://picsum.photos/1920/1080?random={sig}"
 }
 
 # -------------------- Utilities --------------------
 def now_iso():
     return datetime.now(timezone.utc).isoformat()
 
+def _legacy_to_ts(entry: dict) -> dict:
+    # pre-JSONL entries carry ISO "timestamp"/"downloaded_at"; metadata now uses epoch "ts"
+    if "ts" not in entry:
+        for key in ("timestamp", "downloaded_at"):
+            if key in entry:
+                try:
+                    entry["ts"] = datetime.fromisoformat(entry[key]).timestamp()
+                except (TypeError, ValueError):
+                    break  # keep the unparseable original rather than lose it
+                del entry[key]
+                break
+    return entry
+
 def safe_print(*a, **k):
     print(*a, **k)
     sys.stdout.flush()
 
-def append_metadata(entry: dict):
-    # append entry to metadata.json (array)
-    try:
-        text = METADATA_FILE.read_text(encoding="utf-8") or "[]"
-        arr = json.loads(text)
-    except Exception:
-        arr = []
-    arr.append(entry)
+def has_img_ext(name: str) -> bool:
+    # plain string check on the file name; avoids building a Path per candidate
+    _, dot, ext = name.rpartition(".")
+    return bool(dot) and ext.lower() in IMG_EXTS_NODOT
+
+def _migrate_legacy_metadata():
+    # One-time migration: convert the old metadata.json array into JSON Lines.
+    # Written to a temp file and renamed into place, so a failure leaves no partial
+    # metadata.jsonl behind and the migration is retried on the next run.
+    if METADATA_FILE.exists() or not LEGACY_METADATA_FILE.exists():
+        return
+    tmp = METADATA_FILE.with_suffix(".jsonl.tmp")
     try:
-        METADATA_FILE.write_text(json.dumps(arr, indent=2), encoding="utf-8")
+        legacy = json.loads(LEGACY_METADATA_FILE.read_text(encoding="utf-8") or "[]")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in legacy:
+                f.write(json.dumps(_legacy_to_ts(entry), separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, METADATA_FILE)
     except Exception as e:
-        safe_print(f"[!] Could not write metadata: {e}")
+        safe_print(f"[!] Could not migrate metadata.json to metadata.jsonl: {e}")
+        try:
+            tmp.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+_migrate_legacy_metadata()
+
+def append_metadata(entry: dict):
+    # queue entry for metadata.jsonl; flush_metadata() writes it out
+    _MD_QUEUE.append(entry)
+
+def _metadata_line(entry: dict) -> bytes:
+    # compact, one line per entry: metadata is machine-read, so no indent
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+def flush_metadata():
+    """Writes all queued metadata entries to metadata.jsonl in a single write."""
+    global _MD_FH
+    with _MD_LOCK:
+        batch = []
+        while _MD_QUEUE:
+            batch.append(_MD_QUEUE.popleft())
+        if not batch:
+            return
+        try:
+            if _MD_FH is None:
+                _MD_FH = open(METADATA_FILE, "ab")
+            _MD_FH.write(b"".join(_metadata_line(e) for e in batch))
+            _MD_FH.flush()
+        except Exception as e:
+            safe_print(f"[!] Could not write metadata: {e}")
+
+# whatever is still queued when the process exits gets written too
+atexit.register(flush_metadata)
+
+def _start_metadata_flusher(interval: float = METADATA_FLUSH_INTERVAL):
+    """Starts a daemon thread flushing metadata every `interval` seconds. Set the returned event to stop it."""
+    stop = threading.Event()
+
+    def _run():
+        while not stop.wait(interval):
+            flush_metadata()
+
+    threading.Thread(target=_run, name="metadata-flusher", daemon=True).start()
+    return stop
+
+def read_metadata():
+    """Yields parsed metadata entries from metadata.jsonl, skipping broken lines."""
+    flush_metadata()
+    try:
+        with open(METADATA_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield _legacy_to_ts(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        return
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    # write to a temp file and rename over the target so a crash never leaves it half-written
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 def write_session(data: dict):
     try:
-        SESSION_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        if USE_MSGPACK_SESSION:
+            _atomic_write_bytes(SESSION_MSGPACK_FILE, msgpack.packb(data, use_bin_type=True))
+        else:
+            _atomic_write_bytes(SESSION_FILE, json.dumps(data, indent=2).encode("utf-8"))
     except Exception as e:
         safe_print(f"[!] Could not save session: {e}")
 
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return -1
+
 def load_session():
+    # load whichever of session.msgpack / session.json was written last, so a
+    # hand-edited session.json still wins over an older binary session
+    if MSGPACK_AVAILABLE and _mtime(SESSION_MSGPACK_FILE) > _mtime(SESSION_FILE):
+        try:
+            return msgpack.unpackb(SESSION_MSGPACK_FILE.read_bytes(), raw=False)
+        except Exception:
+            pass
     try:
         if SESSION_FILE.exists():
             return json.loads(SESSION_FILE.read_text(encoding="utf-8"))
@@ -97,6 +256,58 @@ def load_session():
     return None
 
 # -------------------- File picker & local copy --------------------
+COPY_WORKERS = 4
+
+def _fast_copy(src, dst):
+    """
+    Copies file data in-kernel with os.copy_file_range where available (reflink on
+    btrfs/XFS), else shutil.copyfile (sendfile on Linux). Then copies metadata like copy2.
+    """
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining > 0:
+                n = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if n == 0:
+                    # no progress (unsupported FS/kernel combo): let copyfile do it
+                    raise OSError("copy_file_range made no progress")
+                remaining -= n
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def _copy_into_session(src):
+    """Copies one picked image into SESSION_IMAGES_DIR. Returns destination path or None."""
+    try:
+        if not has_img_ext(src):
+            return None
+        src_path = Path(src)
+        if not src_path.exists():
+            return None
+        dest = SESSION_IMAGES_DIR / f"{int(time.time())}_{src_path.name}"
+        _fast_copy(src_path, dest)
+        return str(dest.resolve())
+    except Exception as e:
+        safe_print(f"[!] Could not copy {src}: {e}")
+        return None
+
+# hidden Tk root shared by every picker call; created on first use, destroyed at exit
+_TK_ROOT = None
+
+def _destroy_tk():
+    try:
+        _TK_ROOT.destroy()
+    except Exception:
+        pass
+
+def _get_tk():
+    global _TK_ROOT
+    if _TK_ROOT is None:
+        _TK_ROOT = tk.Tk()
+        _TK_ROOT.withdraw()
+        atexit.register(_destroy_tk)
+    return _TK_ROOT
+
 def pick_local_images_and_copy():
     """
     Opens file dialog (if available). Copies chosen images into SESSION_IMAGES_DIR.
@@ -108,42 +319,86 @@ def pick_local_images_and_copy():
         safe_print("    Place images into 'session_images/' folder manually or install tkinter.")
         return []
 
-    root = tk.Tk()
-    root.withdraw()
-    try:
-        files = filedialog.askopenfilenames(
-            title="Select images to add to session_images/",
-            filetypes=[("Image files", "*.jpg *.jpeg *.png *.bmp *.gif *.webp")]
-        )
-    finally:
-        try:
-            root.destroy()
-        except Exception:
-            pass
-
-    for src in files:
-        try:
-            src_path = Path(src)
-            if not src_path.exists() or src_path.suffix.lower() not in IMG_EXTS:
-                continue
-            dest = SESSION_IMAGES_DIR / f"{int(time.time())}_{src_path.name}"
-            shutil.copy2(src_path, dest)
-            picked.append(str(dest.resolve()))
-        except Exception as e:
-            safe_print(f"[!] Could not copy {src}: {e}")
+    root = _get_tk()
+    files = filedialog.askopenfilenames(
+        parent=root,
+        title="Select images to add to session_images/",
+        filetypes=[("Image files", "*.jpg *.jpeg *.png *.bmp *.gif *.webp")]
+    )
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        for dest in ex.map(_copy_into_session, files):
+            if dest:
+                picked.append(dest)
     return picked
 
+# scan cache for session_images/, keyed by the directory's mtime
+_GATHER_CACHE = {"mtime": -1, "result": []}
+
 def gather_images_from_session_folder():
-    imgs = []
     try:
-        for p in SESSION_IMAGES_DIR.iterdir():
-            if p.is_file() and p.suffix.lower() in IMG_EXTS:
-                imgs.append(str(p.resolve()))
+        st = SESSION_IMAGES_DIR.stat().st_mtime_ns
+        if st == _GATHER_CACHE["mtime"]:
+            return list(_GATHER_CACHE["result"])
+        imgs = []
+        # scandir entries carry d_type, so filtering needs no extra stat() per file
+        with os.scandir(SESSION_IMAGES_DIR) as it:
+            for e in it:
+                if has_img_ext(e.name) and e.is_file(follow_symlinks=False):
+                    imgs.append(e.path)
+    except Exception as e:
+        safe_print(f"[!] Error reading session_images/: {e}")
+        return []
+    imgs.sort()
+    _GATHER_CACHE.update(mtime=st, result=imgs)
+    return list(imgs)
+
+def _existing_session_paths() -> set:
+    """Absolute paths of all files currently in session_images/, from a single directory scan."""
+    try:
+        with os.scandir(SESSION_IMAGES_DIR) as it:
+            return {os.path.abspath(e.path) for e in it if e.is_file(follow_symlinks=False)}
     except Exception as e:
         safe_print(f"[!] Error reading session_images/: {e}")
-    return sorted(imgs)
+        return set()
 
 # -------------------- Online downloading (picsum) --------------------
+# Shared HTTP session: keep-alive connection pool + retries for every download
+_SESSION = None
+if REQUESTS_AVAILABLE:
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=DOWNLOAD_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    ))
+
+def _stream_to_file(resp, fpath: Path):
+    # stream the body straight to disk instead of buffering the whole image
+    resp.raw.decode_content = True
+    # write beside the target and rename, so a failed transfer never leaves a
+    # truncated image behind for the cache or the folder watcher to pick up
+    tmp = Path(str(fpath) + ".part")
+    try:
+        with open(tmp, "wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=1 << 16)
+        os.replace(tmp, fpath)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def _fetch_one(theme: str, session):
+    """Downloads a single random image for theme. Returns (filepath, source_url)."""
+    sig = random.randint(1, 2**31 - 1)
+    url = ONLINE_QUERIES[theme](sig)
+    # create unique filename (sig keeps parallel downloads from colliding)
+    fname = f"{theme}_{int(time.time())}_{sig}.jpg"
+    fpath = SESSION_IMAGES_DIR / fname
+    with session.get(url, stream=True, timeout=20) as resp:
+        resp.raise_for_status()
+        _stream_to_file(resp, fpath)
+    return str(fpath.resolve()), url
+
 def download_online_images(theme: str, count: int = 5, force_refresh: bool = False):
     """
     Downloads `count` images for theme into SESSION_IMAGES_DIR.
@@ -159,37 +414,98 @@ def download_online_images(theme: str, count: int = 5, force_refresh: bool = Fal
         theme = "nature"
 
     # cached
-    cached = sorted([p for p in SESSION_IMAGES_DIR.glob(f"{theme}_*") if p.suffix.lower() in IMG_EXTS], key=lambda p: p.stat().st_mtime, reverse=True)
+    prefix = f"{theme}_"
+    with os.scandir(SESSION_IMAGES_DIR) as it:
+        cached = [e for e in it if e.name.startswith(prefix) and has_img_ext(e.name)]
+    cached.sort(key=lambda e: e.stat().st_mtime, reverse=True)
     if cached and not force_refresh:
-        return [str(p.resolve()) for p in cached[:count]]
+        return [e.path for e in cached[:count]]
 
     downloaded = []
-    for i in range(count):
-        try:
-            sig = random.randint(1, 2**31 - 1)
-            url = ONLINE_QUERIES[theme].format(sig=sig)
-            resp = requests.get(url, timeout=20)
-            resp.raise_for_status()
-            # create unique filename
-            fname = f"{theme}_{int(time.time())}_{random.randint(1000,9999)}.jpg"
-            fpath = SESSION_IMAGES_DIR / fname
-            with open(fpath, "wb") as f:
-                f.write(resp.content)
-            downloaded.append(str(fpath.resolve()))
+    if count < 1:
+        return downloaded
+    with ThreadPoolExecutor(max_workers=min(count, DOWNLOAD_WORKERS)) as ex:
+        futures = {ex.submit(_fetch_one, theme, _SESSION): i for i in range(count)}
+        for fut in as_completed(futures):
+            try:
+                fpath, url = fut.result()
+            except Exception as e:
+                safe_print(f"[!] Download error #{futures[fut]+1} for {theme}: {e}")
+                continue
+            downloaded.append(fpath)
             append_metadata({
                 "type": "download",
                 "theme": theme,
-                "filepath": str(fpath.resolve()),
+                "filepath": fpath,
                 "source_url": url,
-                "downloaded_at": now_iso()
+                "ts": time.time()
             })
-            # small polite pause
-            time.sleep(0.2)
-        except Exception as e:
-            safe_print(f"[!] Download error #{i+1} for {theme}: {e}")
     return downloaded
 
 # -------------------- Wallpaper setter: Windows, macOS, GNOME, KDE --------------------
+# KDE Plasma script; %s takes a JS string literal holding the file:// URI
+_KDE_TMPL = ("var Desktops=desktops();for(i=0;i<Desktops.length;i++){d=Desktops[i];"
+             "d.wallpaperPlugin='org.kde.image';"
+             "d.currentConfigGroup=Array('Wallpaper','org.kde.image','General');"
+             "d.writeConfig('Image',%s);}")
+_KDE_IFACE = None
+
+def _kde_evaluate(script: str) -> bool:
+    """Runs a Plasma script through dbus-python (connection cached) or qdbus-qt5 as fallback."""
+    global _KDE_IFACE
+    if DBUS_AVAILABLE:
+        try:
+            if _KDE_IFACE is None:
+                proxy = dbus.SessionBus().get_object("org.kde.plasmashell", "/PlasmaShell")
+                _KDE_IFACE = dbus.Interface(proxy, "org.kde.PlasmaShell")
+            _KDE_IFACE.evaluateScript(script)
+            return True
+        except Exception:
+            _KDE_IFACE = None
+    res = subprocess.run(["qdbus-qt5", "org.kde.plasmashell", "/PlasmaShell", "org.kde.PlasmaShell.evaluateScript", script],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return res.returncode == 0
+
+# Windows: resolve SystemParametersInfoW once with explicit argtypes/restype
+_SPI = None
+if platform.system() == "Windows":
+    try:
+        _user32 = ctypes.WinDLL("user32", use_last_error=True)
+        _SPI = _user32.SystemParametersInfoW
+        _SPI.argtypes = [ctypes.c_uint, ctypes.c_uint, ctypes.c_wchar_p, ctypes.c_uint]
+        _SPI.restype = ctypes.c_bool
+    except Exception:
+        _SPI = None
+
+# Linux: pick the setter for this desktop once, instead of trying each tool per call
+def _gsettings_set(p: Path) -> bool:
+    res = subprocess.run(["gsettings", "set", "org.gnome.desktop.background", "picture-uri", f"file://{p}"],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return res.returncode == 0
+
+def _kde_set(p: Path) -> bool:
+    # Use DBus to tell plasmashell to set wallpaper
+    return _kde_evaluate(_KDE_TMPL % json.dumps(f"file://{p}"))
+
+def _feh_set(p: Path) -> bool:
+    # common in lightweight WMs
+    res = subprocess.run(["feh", "--bg-scale", str(p)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return res.returncode == 0
+
+def _detect_linux_setter():
+    desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").upper()
+    if shutil.which("gsettings") and "GNOME" in desktop:
+        return _gsettings_set
+    if shutil.which("qdbus-qt5") or (DBUS_AVAILABLE and "KDE" in desktop):
+        return _kde_set
+    if shutil.which("feh"):
+        return _feh_set
+    if shutil.which("gsettings"):
+        return _gsettings_set
+    return None
+
+_LINUX_SETTER = _detect_linux_setter() if platform.system() == "Linux" else None
+
 def set_wallpaper(path: str) -> bool:
     """
     Attempt to set wallpaper cross-platform.
@@ -203,36 +519,20 @@ def set_wallpaper(path: str) -> bool:
     try:
         if system == "Windows":
             # SPI_SETDESKWALLPAPER = 20
-            return bool(ctypes.windll.user32.SystemParametersInfoW(20, 0, str(p), 3))
+            if _SPI is None:
+                safe_print("[!] user32.SystemParametersInfoW unavailable.")
+                return False
+            return bool(_SPI(20, 0, str(p), 3))
         elif system == "Darwin":
-            cmd = f"osascript -e 'tell application \"Finder\" to set desktop picture to POSIX file \"{p}\"'"
-            res = os.system(cmd)
-            return res == 0
+            # json.dumps quotes/escapes the path as an AppleScript string literal; no shell involved
+            script = f'tell application "Finder" to set desktop picture to POSIX file {json.dumps(str(p), ensure_ascii=False)}'
+            res = subprocess.run(["osascript", "-e", script], check=False, stdout=subprocess.DEVNULL)
+            return res.returncode == 0
         elif system == "Linux":
-            # Try GNOME (gsettings)
-            try:
-                res = subprocess.call(["gsettings", "set", "org.gnome.desktop.background", "picture-uri", f"file://{p}"])
-                if res == 0:
-                    return True
-            except Exception:
-                pass
-            # Try KDE Plasma (plasma-apply-wallpaperimage may not exist)
-            try:
-                # Use DBus to tell plasmashell to set wallpaper
-                script = f"var Desktops = desktops(); for (i=0;i<Desktops.length;i++) {{ d = Desktops[i]; d.wallpaperPlugin = 'org.kde.image'; d.currentConfigGroup = Array('Wallpaper','org.kde.image','General'); d.writeConfig('Image', 'file://{p}'); }}"
-                res = subprocess.call(["qdbus-qt5", "org.kde.plasmashell", "/PlasmaShell", "org.kde.PlasmaShell.evaluateScript", script])
-                if res == 0:
-                    return True
-            except Exception:
-                pass
-            # Last fallback: try feh (common in lightweight WMs)
-            try:
-                res = subprocess.call(["feh", "--bg-scale", str(p)])
-                return res == 0
-            except Exception:
-                pass
-            safe_print("[!] Could not set wallpaper on this Linux desktop environment.")
-            return False
+            if _LINUX_SETTER is None:
+                safe_print("[!] Could not set wallpaper on this Linux desktop environment.")
+                return False
+            return _LINUX_SETTER(p)
         else:
             safe_print(f"[!] Unsupported OS: {system}")
             return False
@@ -240,6 +540,23 @@ def set_wallpaper(path: str) -> bool:
         safe_print(f"[!] Error setting wallpaper: {e}")
         return False
 
+def current_wallpaper():
+    """
+    Best-effort lookup of the wallpaper currently set (GNOME only, via gsettings).
+    Returns the image path or None if unknown.
+    """
+    if _LINUX_SETTER is not _gsettings_set:
+        return None
+    try:
+        res = subprocess.run(["gsettings", "get", "org.gnome.desktop.background", "picture-uri"],
+                             capture_output=True, text=True, check=False)
+        uri = res.stdout.strip().strip("'")
+        if res.returncode == 0 and uri.startswith("file://"):
+            return uri[len("file://"):]
+    except Exception:
+        pass
+    return None
+
 # -------------------- Menu & interactive flow --------------------
 def prompt_menu():
     safe_print("\n=== WallpaperLooper — Menu ===")
@@ -297,7 +614,8 @@ def main():
                     if REQUESTS_AVAILABLE:
                         online_imgs = download_online_images(cfg.get("theme", "nature"), count=cfg.get("online_count",5), force_refresh=cfg.get("online_refresh", False))
                         images.extend(online_imgs)
-                images = [p for p in images if Path(p).exists()]
+                existing = _existing_session_paths()
+                images = [p for p in images if os.path.abspath(p) in existing]
             if not images:
                 safe_print("[!] Could not find any images for the saved session. Starting fresh menu.")
                 choice = prompt_menu()
@@ -373,10 +691,11 @@ def main():
         images = gather_images_from_session_folder()
         images.extend(online_imgs if 'online_imgs' in locals() else [])
         # dedupe while preserving order
+        existing = _existing_session_paths()
         seen = set()
         final = []
         for p in images:
-            if p not in seen and Path(p).exists():
+            if p not in seen and os.path.abspath(p) in existing:
                 final.append(p)
                 seen.add(p)
         cfg["images"] = final
@@ -394,7 +713,8 @@ def main():
             safe_print("[*] No local images found — attempting fallback online download (nature, 5 images).")
             images = download_online_images("nature", count=5, force_refresh=True)
     # Validate existence
-    images = [p for p in images if Path(p).exists()]
+    existing = _existing_session_paths()
+    images = [p for p in images if os.path.abspath(p) in existing]
     if not images:
         safe_print("[!] Could not prepare any images. Exiting.")
         return
@@ -416,38 +736,210 @@ def main():
     run_loop(images, duration, shuffle)
 
 # -------------------- Runner loop --------------------
+# Set to cut the current wait short and advance to the next wallpaper
+_WAKE = threading.Event()
+# Longest single block on _WAKE; short slices keep Ctrl+C responsive on Windows
+WAKE_SLICE = 0.5
+# Set by the SIGUSR1 handler; polled by _wait_for_next between slices
+_SIGNAL_WAKE = False
+
+def _on_wake_signal(signum, frame):
+    # Only flips a flag: taking _WAKE's lock inside a signal handler can deadlock
+    # if the main thread was interrupted while holding it.
+    global _SIGNAL_WAKE
+    _SIGNAL_WAKE = True
+
+def _wait_for_next(duration: float) -> bool:
+    """
+    Waits up to `duration` seconds for the next wallpaper change.
+    Returns True if woken early (_WAKE set or SIGUSR1), False on timeout.
+    """
+    global _SIGNAL_WAKE
+    deadline = time.monotonic() + duration
+    while True:
+        if _SIGNAL_WAKE:
+            _SIGNAL_WAKE = False
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if _WAKE.wait(min(remaining, WAKE_SLICE)):
+            _WAKE.clear()
+            return True
+
+# Debounce window for session_images/ change bursts (seconds)
+WATCH_DEBOUNCE = 0.2
+
+class _SessionFolderHandler(FileSystemEventHandler):
+    """
+    Watches session_images/ for image files being created, deleted or moved.
+    Once a burst of events settles, the net changes become available through
+    take_changes() and the runner loop is woken. Non-image files are ignored.
+    """
+    def __init__(self):
+        super().__init__()
+        self._timer = None
+        self._lock = threading.Lock()
+        # changes still inside the debounce window
+        self._added = {}        # path -> None, keeps arrival order
+        self._removed = set()
+        # changes flushed and waiting for the runner loop
+        self._ready_added = {}
+        self._ready_removed = set()
+
+    def _record(self, added=None, removed=None):
+        added = os.path.abspath(os.fsdecode(added)) if added and has_img_ext(os.fsdecode(added)) else None
+        removed = os.path.abspath(os.fsdecode(removed)) if removed and has_img_ext(os.fsdecode(removed)) else None
+        if added is None and removed is None:
+            return
+        with self._lock:
+            if removed is not None:
+                self._added.pop(removed, None)
+                self._removed.add(removed)
+            if added is not None:
+                self._removed.discard(added)
+                self._added[added] = None
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(WATCH_DEBOUNCE, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._record(added=event.src_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._record(removed=event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._record(added=event.dest_path, removed=event.src_path)
+
+    def _flush(self):
+        with self._lock:
+            for p in self._removed:
+                self._ready_added.pop(p, None)
+                self._ready_removed.add(p)
+            for p in self._added:
+                self._ready_removed.discard(p)
+                self._ready_added[p] = None
+            self._added, self._removed = {}, set()
+        _GATHER_CACHE["mtime"] = -1
+        _WAKE.set()
+
+    def take_changes(self):
+        """Returns (added paths in arrival order, removed path set) flushed since the last call."""
+        with self._lock:
+            added, removed = list(self._ready_added), self._ready_removed
+            self._ready_added, self._ready_removed = {}, set()
+        return added, removed
+
+    def cancel(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+
+def _start_folder_watch():
+    """Returns (observer, handler) watching session_images/, or (None, None) without watchdog."""
+    if not WATCHDOG_AVAILABLE:
+        return None, None
+    try:
+        handler = _SessionFolderHandler()
+        observer = Observer()
+        observer.schedule(handler, str(SESSION_IMAGES_DIR), recursive=False)
+        observer.daemon = True
+        observer.start()
+        return observer, handler
+    except Exception as e:
+        safe_print(f"[!] Could not watch session_images/: {e}")
+        return None, None
+
+def _save_loop_session(images, duration, shuffle):
+    # update session with current image list, etc.
+    sess = load_session() or {}
+    sess["images"] = images
+    sess["duration"] = duration
+    sess["shuffle"] = shuffle
+    sess["timestamp"] = now_iso()
+    write_session(sess)
+
 def run_loop(images, duration, shuffle):
     safe_print(f"\n[*] Starting wallpaper loop with {len(images)} images — {duration}s per image. Press Ctrl+C to stop.")
+    # POSIX: `kill -USR1 <pid>` switches wallpaper immediately
+    prev_usr1 = None
+    if hasattr(signal, "SIGUSR1"):
+        try:
+            prev_usr1 = signal.signal(signal.SIGUSR1, _on_wake_signal)
+        except ValueError:
+            pass  # not on the main thread
     run_count = 0
     pool = list(images)
+    observer, watcher = _start_folder_watch()
+    md_stop = _start_metadata_flusher()
+    last_save = time.monotonic()
+    # last path handed to the OS; repeats of it skip the set_wallpaper round-trip
+    last_set = current_wallpaper()
+    idx = 0
     try:
-        if shuffle:
-            random.shuffle(pool)
-        for img in cycle(pool):
+        while True:
+            # new epoch: reshuffle so each pass through the pool has a fresh order
+            if idx == 0 and shuffle:
+                random.shuffle(pool)
+            img = pool[idx]
+            idx = (idx + 1) % len(pool)
             run_count += 1
+            noop = (img == last_set)
             entry = {
                 "type": "run",
-                "timestamp": now_iso(),
+                "ts": time.time(),
                 "image": img,
                 "duration": duration,
                 "shuffle": shuffle,
                 "count": run_count
             }
+            if noop:
+                entry["noop"] = True  # already the wallpaper; no OS call made
             append_metadata(entry)
-            ok = set_wallpaper(img)
+            if noop:
+                ok = True
+            else:
+                ok = set_wallpaper(img)
+                last_set = img if ok else None
             safe_print(f"→ [{run_count}] Set: {img} (success={bool(ok)}) — next in {duration}s")
-            time.sleep(duration)
+            if time.monotonic() - last_save >= SESSION_SAVE_INTERVAL:
+                _save_loop_session(images, duration, shuffle)
+                last_save = time.monotonic()
+            _wait_for_next(duration)
+            # session_images/ changed: apply the added/removed images, start a fresh epoch
+            if watcher is not None:
+                added, removed = watcher.take_changes()
+                if added or removed:
+                    known = {os.path.abspath(p) for p in images}
+                    fresh = [p for p in images if os.path.abspath(p) not in removed]
+                    fresh.extend(p for p in added if p not in known)
+                    if fresh:
+                        safe_print(f"[*] session_images/ changed — now looping {len(fresh)} images.")
+                        images = fresh
+                        pool = list(images)
+                        idx = 0
+                    else:
+                        safe_print("[!] All looped images were removed from session_images/; keeping the old list.")
     except KeyboardInterrupt:
         safe_print("\n[*] Stopped by user. Saving session and exiting.")
-        # update session with current image list, etc.
-        sess = load_session() or {}
-        sess["images"] = images
-        sess["duration"] = duration
-        sess["shuffle"] = shuffle
-        sess["timestamp"] = now_iso()
-        write_session(sess)
+        _save_loop_session(images, duration, shuffle)
     except Exception as e:
         safe_print(f"[!] Runtime error: {e}")
+    finally:
+        if prev_usr1 is not None:
+            signal.signal(signal.SIGUSR1, prev_usr1)
+        md_stop.set()
+        flush_metadata()
+        if observer is not None:
+            watcher.cancel()
+            observer.stop()
+            observer.join()
 
 if __name__ == "__main__":
     main()